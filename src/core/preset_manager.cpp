@@ -379,16 +379,18 @@ bool PresetManager::load_preset(const std::string& preset_name,
             return false;
         }
 
-        // Check if file exists
-        if (!std::filesystem::exists(file_path)) {
-            CORE_LOG_WARNING("Preset file does not exist: %s", preset_name.c_str());
-            return false;
-        }
-
         // Load from JSON file
+        // RATIONALE: obs_data_create_from_json_file() returns nullptr both for a
+        // missing file and for unparsable JSON. The existence check only runs on
+        // that failure path to tell the two apart, keeping the happy path free of
+        // an extra stat().
         obs_data_t* data = obs_data_create_from_json_file(file_path.c_str());
         if (!data) {
-            CORE_LOG_ERROR("Failed to load preset file: %s", file_path.c_str());
+            if (!std::filesystem::exists(file_path)) {
+                CORE_LOG_WARNING("Preset file does not exist: %s", preset_name.c_str());
+            } else {
+                CORE_LOG_ERROR("Failed to load preset file: %s", file_path.c_str());
+            }
             return false;
         }
 
@@ -577,15 +579,22 @@ bool PresetManager::load_preset(const std::string& preset_name,
     }
 
     std::string file_path = get_preset_file_path(preset_name);
-    if (file_path.empty() || !std::filesystem::exists(file_path)) {
-        CORE_LOG_ERROR("Preset file does not exist: %s", file_path.c_str());
+    if (file_path.empty()) {
+        CORE_LOG_ERROR("Failed to get preset file path");
         return false;
     }
 
     try {
+        // RATIONALE: Opening the stream directly replaces an up-front
+        // std::filesystem::exists() check. The existence check only runs when the
+        // open fails, to report "missing" and "unreadable" separately.
         std::ifstream file(file_path);
         if (!file.is_open()) {
-            CORE_LOG_ERROR("Failed to open file for reading: %s", file_path.c_str());
+            if (!std::filesystem::exists(file_path)) {
+                CORE_LOG_ERROR("Preset file does not exist: %s", file_path.c_str());
+            } else {
+                CORE_LOG_ERROR("Failed to open file for reading: %s", file_path.c_str());
+            }
             return false;
         }
 